@@ -2,14 +2,82 @@
 
 import rich_click as click
 import pandas
-import json
+import ast
 import datetime
 import os
 import sys
 
+from concurrent.futures import ThreadPoolExecutor
 from functools import partial
 from rich.console import Console
 from pathlib import Path
+from typing import Generator
+
+# Shared rich IO
+console: Console = Console()
+
+# Columns summarized in the report
+described_columns: tuple[str, ...] = (
+    "s",
+    "runtime",
+    "mem_mib",
+    "max_vms",
+    "size_mb",
+    "wasted",
+    "efficiency",
+)
+
+# Benchmark columns loaded from the files, others are ignored at parse time
+benchmark_columns: frozenset[str] = frozenset(
+    (
+        "jobid",
+        "rule_name",
+        "wildcards",
+        "params",
+        "threads",
+        "s",
+        "h:m:s",
+        "max_rss",
+        "max_vms",
+        "max_uss",
+        "max_pss",
+        "io_in",
+        "io_out",
+        "mean_load",
+        "cpu_time",
+        "cpu_usage",
+        "resources",
+        "input_size_mb",
+        "mem_mb",
+        "mem_gb",
+        "runtime",
+        "walltime",
+        "time_min",
+    )
+)
+
+# Measures and resources expected to be numeric
+numeric_columns: tuple[str, ...] = (
+    "s",
+    "max_rss",
+    "max_vms",
+    "max_uss",
+    "max_pss",
+    "io_in",
+    "io_out",
+    "mean_load",
+    "cpu_time",
+    "mem_mb",
+    "mem_mib",
+    "runtime",
+)
+
+# Columns identifying a benchmark file in the cache
+cache_columns: tuple[str, ...] = (
+    "benchmark_path",
+    "benchmark_mtime",
+    "benchmark_size",
+)
 
 
 def hhmmss(seconds: int | float) -> str:
@@ -19,17 +87,29 @@ def hhmmss(seconds: int | float) -> str:
     return str(datetime.timedelta(seconds=int(seconds)))
 
 
-def nb(number: str | int | float) -> str:
+def nb(number: int | float) -> float:
     """
     Format number with 2 floating point digits
     """
-    if isinstance(number, str):
-        return f"{number:.2f}"
-    return round(number, 2)
+    return round(float(number), 2)
+
+
+def as_text(value: float, colname: str, seconds: bool = False) -> str | float:
+    """
+    Convert a summary value to seconds or to a human readable
+    duration when the column holds a duration
+    """
+    if colname == "runtime":
+        # Reserved runtime is expressed in minutes
+        value = value * 60
+    elif colname != "s":
+        return value
+
+    return value if seconds is True else hhmmss(value)
 
 
 def extract_text(
-    df: pandas.DataFrame,
+    stats: pandas.DataFrame,
     colname: str,
     unit: str,
     val: str = "mean",
@@ -37,30 +117,17 @@ def extract_text(
     seconds: bool = False,
 ) -> str:
     """
-    Return the mean and std of a dataframe column as text
+    Return the mean and std of a column from a
+    `describe()` table as text
     """
-    desc = df[[colname]].describe()
-    val = nb(desc.loc[val][colname])
-    if (colname == "s") and (not seconds):
-        val = hhmmss(val)
-    elif colname == "runtime":
-        if seconds is True:
-            val = val * 60
-        else:
-            val = hhmmss(val * 60)
-
-    std = ""
-    if with_std is True:
-        std = nb(desc.loc["std"][colname])
-        if (colname == "s") and (not seconds):
-            std = hhmmss(std)
-        elif colname == "runtime":
-            if seconds is True:
-                std = std * 60
-            else:
-                std = hhmmss(std * 60)
-    if std != "":
-        std = f"± {std}"
+    val = as_text(nb(stats.loc[val, colname]), colname, seconds)
+
+    # Standard deviation is not defined for rules with a single job
+    std = stats.loc["std", colname]
+    if with_std is True and pandas.notna(std):
+        std = f"± {as_text(nb(std), colname, seconds)}"
+    else:
+        std = ""
 
     return f"""{val} {std} {unit}""".strip()
 
@@ -89,17 +156,13 @@ def describe_rule(
     df: pandas.DataFrame, rule_name: str, verbose: bool, console: Console
 ) -> dict[str, str]:
     """
-    Return text to describe rule requirements and reservation
+    Return text to describe rule requirements and reservation,
+    given the benchmarks of this rule only
     """
-    tmp = None
     if verbose is True:
         console.print(f"Working on rule {rule_name}", style="green")
 
-    if rule_name != "all":
-        tmp = df[df["rule_name"] == rule_name].copy()
-    else:
-        tmp = df.copy()
-    tmp = tmp.describe()
+    tmp = df[list(described_columns)].describe()
 
     return {
         "mean_time": mean_time(tmp),
@@ -113,8 +176,8 @@ def describe_rule(
         "reserved_runtime": reserved_runtime(tmp),
         "time_efficiency": nb(
             100
-            * float(time_at_most(tmp, seconds=True))
-            / max(float(reserved_runtime(tmp, seconds=True)), 1)
+            * as_text(nb(tmp.loc["max", "s"]), "s", seconds=True)
+            / max(as_text(nb(tmp.loc["mean", "runtime"]), "runtime", seconds=True), 1)
         ),
     }
 
@@ -123,9 +186,8 @@ def save_as_markdown(
     description: dict[str, str], output: str | Path, verbose: bool, console: Console
 ) -> None:
     """
-    Save the dictionary as a Markdown file
+    Save the dictionary as a Markdown file, one rule at a time
     """
-    global_content = None
     with open(output, "w") as markdown_stream:
         for rule, summary in description.items():
             rule_content = [
@@ -151,61 +213,99 @@ def save_as_markdown(
                 f"and {summary['time_efficiency']}% for time.",
                 "",
             ]
-            if global_content is None:
-                global_content = rule_content.copy()
-            else:
-                global_content += rule_content
-
-        markdown_stream.write("\n".join(global_content))
+            markdown_stream.write("\n".join(rule_content))
+            markdown_stream.write("\n")
 
 
-def search_benchmarks(dir_path: str | Path, verbose: bool, console: Console):
+def search_benchmarks(
+    dir_path: str | Path, verbose: bool, console: Console
+) -> Generator[Path, None, None]:
     """
     Search and return paths to all benchmark files
     within the benchmark directory
     """
-    if isinstance(dir_path, str):
-        dir_path = Path(dir_path)
+    for root, _, files in os.walk(dir_path):
+        if verbose is True:
+            console.print(f"Looking for benchmark files in {root}...", style="green")
+
+        for name in files:
+            if name.endswith(".tsv") and not name.endswith("_target.tsv"):
+                yield Path(root, name)
 
-    for path in dir_path.iterdir():
-        if path.is_dir():
-            if verbose is True:
-                console.print(
-                    f"Looking for benchmark files in {dir_path}...", style="green"
-                )
 
-            yield from search_benchmarks(
-                dir_path=path, verbose=verbose, console=console
-            )
+def load_cache(
+    cache: str | Path, verbose: bool, console: Console
+) -> dict[tuple[str, float, int], pandas.DataFrame]:
+    """
+    Load previously parsed benchmark files, indexed by
+    their path, modification time and size. The cache is
+    unpickled: it must come from a trusted location.
+    """
+    if not os.path.exists(cache):
+        return {}
 
-        if path.name.endswith(".tsv"):
-            yield path
+    if verbose is True:
+        console.print(f"Loading cached benchmarks from {cache}...", style="green")
+    cached = pandas.read_pickle(cache)
+    return dict(iter(cached.groupby(list(cache_columns), sort=False)))
+
+
+def read_benchmark(
+    path: Path,
+    cached: dict[tuple[str, float, int], pandas.DataFrame],
+    verbose: bool,
+    console: Console,
+) -> pandas.DataFrame:
+    """
+    Load a single benchmark file, unless it is
+    already cached and unchanged
+    """
+    stat = path.stat()
+    key = (str(path), stat.st_mtime, stat.st_size)
+    if key in cached:
+        return cached[key]
+
+    if verbose is True:
+        console.print(f"Loading {path}...", style="green")
+    tmp = pandas.read_csv(
+        path, sep="\t", header=0, usecols=lambda column: column in benchmark_columns
+    )
+    return tmp.assign(**dict(zip(cache_columns, key)))
 
 
 def concat_frames(
-    paths: list[Path], verbose: bool, console: Console
+    paths: list[Path],
+    verbose: bool,
+    console: Console,
+    cache: str | Path | None = None,
 ) -> pandas.DataFrame:
     """
-    Append multiple dataframes row by row
+    Load multiple dataframes in parallel and concatenate them row by row
     """
-    df = None
-    for path in paths:
-        if path.name.endswith("_target.tsv"):
-            continue
-        if verbose is True:
-            console.print(f"Loading {path}...", style="green")
-        tmp = pandas.read_csv(path, sep="\t", header=0)
-        if df is None:
-            df = tmp.copy()
-        elif len(df) > 0:
-            df = pandas.concat([df, tmp], axis=0)
-        elif verbose is True:
-            console.print(":wagning: This report had no content.", style="dark_orange")
+    cached = {} if cache is None else load_cache(cache, verbose, console)
 
+    frames: list[pandas.DataFrame] = []
+    with ThreadPoolExecutor() as executor:
+        tables = executor.map(
+            partial(read_benchmark, cached=cached, verbose=verbose, console=console),
+            paths,
+        )
+        for tmp in tables:
+            if len(tmp) > 0:
+                frames.append(tmp)
+            elif verbose is True:
+                console.print(
+                    ":warning: This report had no content.", style="dark_orange"
+                )
+
+    df = pandas.concat(frames, axis=0, ignore_index=True)
     if verbose is True:
         console.print(f"Loaded {len(df)} benchmark reports.", style="green")
 
-    return df.reset_index()
+    if cache is not None:
+        df.to_pickle(cache)
+
+    return df.drop(columns=list(cache_columns))
 
 
 def preprocess(
@@ -217,42 +317,40 @@ def preprocess(
     """
     if verbose is True:
         console.print("Expanding information from the benchmarks...", style="green")
-    df["rule_jobname"] = [f"{j}.{r}" for j, r in zip(df.jobid, df.rule_name)]
+    df["rule_jobname"] = df["jobid"].astype(str) + "." + df["rule_name"]
 
     # Explode resources
-    resources = pandas.DataFrame(
-        [
-            json.loads(data.replace("'", '"')) if not isinstance(data, float) else {}
-            for data in pandas.Series(df.resources.explode())
-        ]
+    resources = pandas.json_normalize(
+        df["resources"].fillna("{}").map(ast.literal_eval).tolist()
     )
-    df = pandas.concat([df.copy(), resources.reset_index()], axis=1)
+    resources.index = df.index
+    df = pandas.concat([df, resources], axis=1)
+
+    # Missing measures are reported as "-" by Snakemake
+    numeric = [colname for colname in numeric_columns if colname in df.columns]
+    df[numeric] = df[numeric].apply(pandas.to_numeric, errors="coerce")
 
     # Explode size
     if verbose is True:
         console.print("Adding new information in the table...", style="green")
-    df["size_mb"] = [
-        sum(
-            [
-                i
-                for i in json.loads(
-                    (
-                        data.replace("'", '"').values()
-                        if not isinstance(data, float | str)
-                        else "{}"
-                    )
-                )
-                if i is not pandas.NA
-            ]
-        )
-        for data in pandas.Series(df.input_size_mb.explode())
-    ]
+    df["size_mb"] = (
+        df["input_size_mb"]
+        .fillna("{}")
+        .astype(str)
+        .map(ast.literal_eval)
+        .map(lambda sizes: sum(size for size in sizes.values() if size is not None))
+    )
 
     # Efficiency
-    df["efficiency"] = [
-        (100 * vss) / mb if mb > 0 else 100 for vss, mb in zip(df.max_vms, df.mem_mb)
-    ]
-    df["wasted"] = [mb - vss if mb > 0 else 0 for vss, mb in zip(df.max_vms, df.mem_mb)]
+    reserved = df["mem_mb"] > 0
+    df["efficiency"] = (100 * df["max_vms"] / df["mem_mb"]).where(reserved, 100)
+    df["wasted"] = (df["mem_mb"] - df["max_vms"]).where(reserved, 0)
+
+    # Shrink memory footprint before summarizing
+    df = df.astype({colname: "float32" for colname in df.select_dtypes("float64")})
+    integers = df.select_dtypes("int64").columns
+    df[integers] = df[integers].apply(pandas.to_numeric, downcast="integer")
+    df["rule_name"] = df["rule_name"].astype("category")
     return df
 
 
@@ -285,6 +383,13 @@ def preprocess(
     default=f"{os.getcwd()}/benchmark.tsv",
     type=click.Path(),
 )
+@click.option(
+    "--cache",
+    help="Path to a cache of parsed benchmark files, re-used across runs. "
+    "The cache is a pickle file: only use trusted locations",
+    default=None,
+    type=click.Path(),
+)
 @click.option(
     "-v",
     "--verbose",
@@ -297,6 +402,7 @@ def main(
     output: str | Path = f"{os.getcwd()}/resources.txt",
     table: str | Path = f"{os.getcwd()}/resources.csv",
     complete: str | Path = f"{os.getcwd()}/benchmark.tsv",
+    cache: str | Path | None = None,
     verbose: bool = False,
 ) -> None:
     """
@@ -304,19 +410,16 @@ def main(
     and produce a usage report more reliable than
     seff.
     """
-    console = Console()
     file_list = sorted(search_benchmarks(benchmark, verbose, console))
-    df: pandas.DataFrame = concat_frames(file_list, verbose, console)
-    df = preprocess(df.copy(), verbose, console)
+    df: pandas.DataFrame = concat_frames(file_list, verbose, console, cache=cache)
+    df = preprocess(df, verbose, console)
     df.to_csv(complete, sep=",", header=True, index=False)
-    rules = list(set(df.rule_name))
 
     # Building report summary
     console.print("Summerizing reports...", style="green")
     description = {"General Pipeline": describe_rule(df, "all", verbose, console)}
-    description.update(
-        **{rule: describe_rule(df, rule, verbose, console) for rule in rules}
-    )
+    for rule, rule_df in df.groupby("rule_name", sort=False, observed=True):
+        description[rule] = describe_rule(rule_df, rule, verbose, console)
 
     # Saving results
     console.print("Saving results...", style="green")
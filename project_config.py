@@ -2,12 +2,24 @@
 
 import rich_click as click
 import os
+import re
 import yaml
 import sys
 
 from rich.console import Console
 from pathlib import Path
 
+try:
+    from yaml import CSafeDumper as Dumper
+except ImportError:
+    from yaml import SafeDumper as Dumper
+
+# Shared rich IO
+console: Console = Console()
+
+# Snakemake module source: github("owner/pipeline", path="...", tag="version")
+github_regex = re.compile(r'^\s+github\("([^"]+)".*"([^"]+)"', re.MULTILINE)
+
 
 def check_path(path: str) -> None:
     """Check if path exists"""
@@ -44,6 +56,18 @@ def check_path(path: str) -> None:
     default=f"{os.getcwd()}/workflow/Snakefile",
     help="Path to the snakefile",
 )
+@click.option(
+    "--pipeline",
+    type=str,
+    default="None",
+    help="Pipeline name, read from the snakefile if not provided",
+)
+@click.option(
+    "--tag",
+    type=str,
+    default="None",
+    help="Pipeline version, read from the snakefile if not provided",
+)
 @click.option(
     "--fastq_screen_config",
     type=click.Path(),
@@ -67,6 +91,8 @@ def create_config(
     genomes: Path | str = f"{os.getcwd()}/config/genomes.csv",
     output: Path | str = f"{os.getcwd()}/config/config.yaml",
     workflow: Path | str = f"{os.getcwd()}/workflow/Snakefile",
+    pipeline: str = "None",
+    tag: str = "None",
     fastq_screen_config: (
         Path | str
     ) = "/mnt/beegfs/database/bioinfo/Index_DB/Fastq_Screen/0.14.0/fastq_screen.conf",
@@ -75,16 +101,18 @@ def create_config(
     verbose: bool = False,
 ) -> None:
     """Create a configuration file suitable for the pipelines"""
-    console = Console()
-
     if verbose:
         console.print(f"Configuring pipeline...", style="green")
 
-    pipeline: str = "Unknown"
-    tag: str = "Unknown"
+    # The snakefile is only read when pipeline name or version is missing
+    search_version: bool = "None" in (pipeline, tag)
 
     # Check file path
-    for file_path in (samples, genomes, workflow):
+    file_paths: list[Path | str] = [samples, genomes]
+    if search_version:
+        file_paths.append(workflow)
+
+    for file_path in file_paths:
         try:
             check_path(file_path)
         except FileNotFoundError:
@@ -92,29 +120,34 @@ def create_config(
             sys.exit(1)
 
     # Search pipeline version and name
-    with open(workflow, "r") as snakefile_stream:
-        for line in snakefile_stream:
-            if line.startswith("        github("):
-                content: list[str] = line.split('"')
-                pipeline = content[1].split("/")[-1]
-                tag = content[-2]
-                break
+    if search_version:
+        with open(workflow, "r") as snakefile_stream:
+            github = github_regex.search(snakefile_stream.read())
+
+        found: tuple[str, str] = ("Unknown", "Unknown")
+        if github:
+            found = (github.group(1).split("/")[-1], github.group(2))
         else:
             console.print(
                 f":warning: warning: Could not find pipeline version",
                 style="dark_orange",
             )
 
+        if pipeline == "None":
+            pipeline = found[0]
+        if tag == "None":
+            tag = found[1]
+
     # Content of the fonciguration file
     config: dict[str, dict[str, str] | str] = {
-        "genomes": genomes,
-        "samples": samples,
+        "genomes": str(genomes),
+        "samples": str(samples),
         "pipeline": {
             "name": pipeline,
             "tag": tag,
         },
         "params": {
-            "fair_fastqc_multiqc_fastq_screen_config": fastq_screen_config,
+            "fair_fastqc_multiqc_fastq_screen_config": str(fastq_screen_config),
         },
     }
 
@@ -128,10 +161,12 @@ def create_config(
             config["params"][key] = value
 
     # Save configuration
-    if force or (not Path(output).exists):
+    if force or (not Path(output).exists()):
         with open(output, "w") as yaml_stream:
             console.print(config, style="green")
-            yaml.dump(config, yaml_stream, default_flow_style=False)
+            yaml.dump(config, yaml_stream, Dumper=Dumper, default_flow_style=False)
+    else:
+        console.print(":warning: Existing file not over-written", style="dark_orange")
 
     if verbose:
         console.print(
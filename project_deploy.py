@@ -3,12 +3,19 @@
 import requests
 import rich_click as click
 import git
+import json
 import os
+import tempfile
+import time
 
-from snakedeploy.deploy import deploy
+from functools import lru_cache
+from snakedeploy.deploy import deploy, WorkflowDeployer
 from rich.console import Console
 from pathlib import Path
 
+# Shared rich IO
+console: Console = Console()
+
 # List of available pipelines
 pipelines: tuple[str] = (
     "fair_genome_indexer",
@@ -20,6 +27,97 @@ pipelines: tuple[str] = (
     "fair_macs2_calling",
 )
 
+# Latest pipeline versions are cached on disk for an hour
+tag_cache: Path = (
+    Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache"))
+    / "bigr_utils"
+    / "latest_tags.json"
+)
+tag_cache_ttl: int = 3600
+
+
+@lru_cache
+def latest_tag(pipeline: str) -> str:
+    """Return the most recent released version of a pipeline"""
+    try:
+        response = requests.get(
+            f"https://api.github.com/repos/tdayris/{pipeline}/releases/latest",
+            headers={"Accept": "application/vnd.github+json"},
+            timeout=5,
+        )
+        response.raise_for_status()
+        return response.json()["tag_name"]
+    except (requests.RequestException, KeyError):
+        # Unauthenticated API calls are rate limited: fallback to git
+        # https://github.com/gitpython-developers/GitPython/issues/1071
+        g = git.cmd.Git()
+        blob: str = g.ls_remote(
+            f"https://github.com/tdayris/{pipeline}",
+            tags=True,
+            refs=True,
+            sort="-v:refname",
+        )
+        return blob.split("\n")[0].split("/")[-1]
+
+
+def cached_latest_tag(pipeline: str, refresh: bool = False) -> str:
+    """
+    Return the most recent released version of a pipeline,
+    from the on-disk cache when it is recent enough
+    """
+    cache: dict[str, dict[str, str | float]] = {}
+    try:
+        with open(tag_cache, "r") as tag_cache_stream:
+            cache = json.load(tag_cache_stream)
+    except (OSError, ValueError):
+        pass  # Missing or corrupted cache
+
+    # Any unexpected cache structure is a cache miss
+    if not isinstance(cache, dict):
+        cache = {}
+    cached: dict[str, str | float] | None = cache.get(pipeline)
+    if (
+        (not refresh)
+        and isinstance(cached, dict)
+        and isinstance(cached.get("tag"), str)
+        and isinstance(cached.get("time"), (int, float))
+        and (time.time() - cached["time"] < tag_cache_ttl)
+    ):
+        return cached["tag"]
+
+    tag: str = latest_tag(pipeline)
+    cache[pipeline] = {"tag": tag, "time": time.time()}
+    try:
+        tag_cache.parent.mkdir(parents=True, exist_ok=True)
+        with open(tag_cache, "w") as tag_cache_stream:
+            json.dump(cache, tag_cache_stream)
+    except OSError:
+        pass  # Caching is optional, e.g. on read-only home directories
+
+    return tag
+
+
+class ShallowWorkflowDeployer(WorkflowDeployer):
+    """
+    Snakedeploy workflow deployer working on a shallow
+    clone of the requested tag, instead of the whole history
+    """
+
+    @property
+    def repo_clone(self) -> str:
+        if self._cloned is None:
+            self._cloned = tempfile.TemporaryDirectory()
+            git.Repo.clone_from(
+                self.provider.source_url,
+                self._cloned.name,
+                depth=1,
+                branch=self.tag,
+                single_branch=True,
+                no_tags=True,
+            )
+
+        return self._cloned.name
+
 
 @click.command(context_settings={"show_default": True})
 @click.argument("pipeline", type=click.Choice(pipelines), required=True)
@@ -28,9 +126,21 @@ pipelines: tuple[str] = (
     "-w",
     "--workdir",
     type=click.Path(),
-    default=os.getcwd(),
+    default=None,
+    show_default="current working directory",
     help="Path to working directory",
 )
+@click.option(
+    "--refresh_tag",
+    is_flag=True,
+    default=False,
+    help="Ignore the cached latest version of the pipeline",
+)
+@click.option(
+    "--shallow/--no-shallow",
+    default=True,
+    help="Only clone the requested tag, without the repository history",
+)
 @click.option(
     "-f", "--force", is_flag=True, help="Force pipeline over-writing", default=False
 )
@@ -41,12 +151,13 @@ pipelines: tuple[str] = (
 def deploy_pipeline(
     pipeline: str,
     tag: str = "latest",
-    workdir: str | Path = os.getcwd(),
+    workdir: str | Path | None = None,
+    refresh_tag: bool = False,
+    shallow: bool = True,
     force: bool = False,
     verbose: bool = False,
 ) -> None:
     """Deploy a snakemake pipeline"""
-    console = Console()
     if verbose:
         console.print(f"Deploying {pipeline}...", style="green")
 
@@ -54,32 +165,35 @@ def deploy_pipeline(
     git_address: str = f"https://github.com/tdayris/{pipeline}"
     name: str = pipeline.capitalize()
 
-    # Get latest tag through blob name
-    # https://github.com/gitpython-developers/GitPython/issues/1071
+    # Get latest released tag
     if tag == "latest":
-        g = git.cmd.Git()
-        blob: str = g.ls_remote(git_address, tags=True)
-        tag = blob.split("\n")[0].split("/")[-1]
+        tag = cached_latest_tag(pipeline, refresh=refresh_tag)
         if verbose:
             console.print(f"Pipeline version is: {tag}", style="green")
 
-    # Build IO directories
-    if isinstance(workdir, str):
-        workdir = Path(workdir)
+    # Build IO directories, relative to the directory
+    # the command is run from, not the one it was imported from
+    workdir = Path.cwd() if workdir is None else Path(workdir)
 
     config_dir: Path = workdir / "config"
     workflow_dir: Path = workdir / "workflow"
 
     # Deploy pipelines
     if force or (not (config_dir.exists() or workflow_dir.exists())):
-        deploy(
-            source_url=git_address,
-            name=name,
-            tag=tag,
-            branch=None,
-            dest_path=workdir,
-            force=force,
-        )
+        if shallow:
+            with ShallowWorkflowDeployer(
+                source=git_address, dest=workdir, tag=tag, force=force
+            ) as deployer:
+                deployer.deploy(name=name)
+        else:
+            deploy(
+                source_url=git_address,
+                name=name,
+                tag=tag,
+                branch=None,
+                dest_path=workdir,
+                force=force,
+            )
     elif verbose:
         console.print(
             f":warning: warning: A pipeline has already been deployed at `{workdir.resolve()}`",
@@ -2,39 +2,72 @@
 
 import re
 import rich_click as click
+import csv
 import os
 import sys
-import pandas
 
 from collections import defaultdict
 from functools import partial
-from pathlib import Path
-from more_itertools import chunked_even
+from pathlib import Path, PurePath
 from rich.console import Console
 from typing import Generator
 
+# Shared rich IO
+console: Console = Console()
+
+# Directory entries never searched for input files
+skipped_names: frozenset[str] = frozenset(
+    (".git", ".snakemake", "__pycache__", ".ipynb_checkpoints", ".DS_Store")
+)
+
+# Columns of the samples table, as expected by pipelines
+sample_columns: tuple[str, ...] = (
+    "sample_id",
+    "upstream_file",
+    "downstream_file",
+    "species",
+    "build",
+    "release",
+)
+
+# File name patterns used to classify input files
+fastq_regex: re.Pattern = re.compile(r"(_|\.)?f(ast)?q(\.gz)?$")
+bed_regex: re.Pattern = re.compile(r"(_|\.)bed(\.gz)?$")
+index_regex: re.Pattern = re.compile(r"_I\d+(_|\.)")
+r1_regex: re.Pattern = re.compile(r"_R?1(_|\.)")
+r2_regex: re.Pattern = re.compile(r"_R?2(_|\.)")
+
+# File name suffixes removed to guess sample names
+strand_suffix_regex: re.Pattern = re.compile(r"_R?(1|2)$")
+lane_suffix_regex: re.Pattern = re.compile(r"_L[0-9]+$")
+ekdn_regex: re.Pattern = re.compile(r"_E(K|R)DN[0-9]+")
+
 
 def filter_regex(
-    regex: str, paths: list[Path], console: Console, verbose: bool = True
-) -> tuple[list[Path]]:
+    regex: str | re.Pattern,
+    paths: list[PurePath],
+    console: Console,
+    verbose: bool = True,
+) -> tuple[list[PurePath]]:
     """
-    Filter-out samples answering a given regex
+    Filter-out samples answering a given regex. Filtering is
+    lexical and only considers file names, not parent directories.
 
     Parameters:
-    regex   str       : Regular expression used to filter the list of files
-    paths   list[Path]: List of files to filter
-    console Console   : rich IO
+    regex   str|Pattern   : Regular expression used to filter the list of files
+    paths   list[PurePath]: List of files to filter
+    console Console       : rich IO
 
     Return:
-    two lists of Path
+    two lists of PurePath
     1. files to keep
     2. filtered-out files
     """
     regex = re.compile(regex)
-    kept: list[str] = [path for path in paths if regex.search(str(path.resolve()))]
-    not_kept: list[str] = [
-        path for path in paths if not regex.search(str(path.resolve()))
-    ]
+    kept: list[PurePath] = []
+    not_kept: list[PurePath] = []
+    for path in paths:
+        (kept if regex.search(path.name) else not_kept).append(path)
 
     if verbose:
         console.print(
@@ -51,25 +84,39 @@ def filter_regex(
 
 
 def flag_identical_names(
-    paths: list[Path], console: Console, verbose: bool = True
-) -> dict[str, list[Path]]:
+    paths: list[PurePath], console: Console, verbose: bool = True
+) -> dict[str, dict[str, list[PurePath]] | list[str]]:
     """
     Find samples with identical file name and different file paths
 
     Parameters:
-    paths   list[Path]: List of files to group
+    paths   list[PurePath]: List of files to group
 
     Return:
-    dictionary: key = sample file name, values = list of paths
+    dictionary:
+    1. groups: key = sample file name, values = list of paths
+    2. duplicated: file names shared by multiple paths
+    3. unique: file names found only once
     """
-    result: dict[str, list[Path]] = defaultdict(list)
+    # Names are flagged while grouping, dictionaries keep them ordered
+    groups: dict[str, list[PurePath]] = {}
+    unique: dict[str, None] = {}
+    duplicated: dict[str, None] = {}
+    group = groups.setdefault
     for path in paths:
-        result[path.name].append(path)
-
-    result["duplicated"] = [
-        sample for sample, paths in result.items() if len(paths) > 1
-    ]
-    result["unique"] = [sample for sample, paths in result.item() if len(paths) == 1]
+        name: str = path.name
+        group(name, []).append(path)
+        if name in unique:
+            del unique[name]
+            duplicated[name] = None
+        elif name not in duplicated:
+            unique[name] = None
+
+    result: dict[str, dict[str, list[PurePath]] | list[str]] = {
+        "groups": groups,
+        "duplicated": list(duplicated),
+        "unique": list(unique),
+    }
 
     if verbose:
         console.print(
@@ -84,40 +131,35 @@ def flag_identical_names(
 
 
 def detect_pattern(
-    paths: list[Path], regex: str, console: Console, verbose: bool = True
-) -> tuple[list[Path] | None]:
+    paths: list[PurePath],
+    regex: str | re.Pattern,
+    console: Console,
+    verbose: bool = True,
+) -> tuple[list[PurePath]]:
     """
     Search for pattern in all sample names.
 
     Parameters:
-    paths   list[Path]: List of files to check
-    regex   str       : Regular expression to search
+    paths   list[PurePath]: List of files to check
+    regex   str|Pattern   : Regular expression to search
 
     Return:
-    True if:
-    1. regex exists
-    2. regex exists for all or one out of two samples
+    two lists of PurePath
+    1. files answering the regex, empty if no file answered
+    2. other files
     """
-    answering, not_answering = filter_regex(
-        paths=paths, regex=regex, verbose=verbose, console=console
-    )
-    if (answering is not None) or (len(answering) > 0):
-        return (
-            answering,
-            not_answering,
-        )
-    return (None, paths)
+    return filter_regex(regex=regex, paths=paths, console=console, verbose=verbose)
 
 
-detect_fastq = partial(detect_pattern, regex=r"(_|\.)?f(ast)?q(\.gz)?$")
-detet_capture_kit = partial(detect_pattern, regex=r"(_|\.)bed(\.gz)?")
-detect_index = partial(detect_pattern, regex=r"_I[\d+](_|\.)")
-detect_R1_strand = partial(detect_pattern, regex=r"_R?1(_|\.)?")
-detect_R2_strand = partial(detect_pattern, regex=r"_R?2(_|\.)?")
+detect_fastq = partial(detect_pattern, regex=fastq_regex)
+detet_capture_kit = partial(detect_pattern, regex=bed_regex)
+detect_index = partial(detect_pattern, regex=index_regex)
+detect_R1_strand = partial(detect_pattern, regex=r1_regex)
+detect_R2_strand = partial(detect_pattern, regex=r2_regex)
 
 
 def filter_non_fastq_files(
-    paths: list[Path],
+    paths: list[PurePath],
     annotation: dict[str, list[str]],
     console: Console,
     verbose: bool = True,
@@ -127,7 +169,7 @@ def filter_non_fastq_files(
 
     Parameters
     paths       list[str]           : List of paths to filter
-    annotation  dict[str, list[str]]: Annotated files
+    annotation  dict[str, list[str]]: Annotated files, updated in place
 
     Return:
     list[str]               Filtered paths
@@ -136,39 +178,36 @@ def filter_non_fastq_files(
     fastq_files, other_files = detect_fastq(
         paths=paths, console=console, verbose=verbose
     )
-    if isinstance(other_files, list) and len(other_files) >= 1:
+    if other_files:
         # Deal with capture-kit file
         bed_files, other_files = detet_capture_kit(
             other_files, console=console, verbose=verbose
         )
 
-        if bed_files is None:
+        if len(bed_files) == 1:
             if verbose:
                 console.print(
-                    "There were no bed files (flagged as suspected capture kit file)",
+                    f"File flagged as suspected capture kit: {bed_files=}",
                     style="green",
                 )
-
-        elif isinstance(bed_files, list) and len(bed_files) == 1:
-            if verbose:
-                console.print(
-                    "File flagged as suspected capture kit: {bed_files=}", style="green"
-                )
             annotation["capture_kit_bed"] = bed_files
-            annotation["non_fastq_files"] = list(sorted(other_files))
 
         else:
-            annotation["non_fastq_files"] = list(sorted(bed_files))
+            if verbose and not bed_files:
+                console.print(
+                    "There were no bed files (flagged as suspected capture kit file)",
+                    style="green",
+                )
+            other_files = sorted(other_files + bed_files)
 
         # Keep track of remaining files (xml, txt, ...)
-        if isinstance(other_files, list) and len(other_files) >= 1:
-            annotation["non_fastq_files"] += list(sorted(other_files))
+        annotation["non_fastq_files"] = other_files
 
     return fastq_files, annotation
 
 
 def filter_index_fastq_files(
-    paths: list[Path],
+    paths: list[PurePath],
     annotation: dict[str, list[str]],
     console: Console,
     verbose: bool = True,
@@ -178,7 +217,7 @@ def filter_index_fastq_files(
 
     Parameters
     paths       list[str]           : List of paths to filter
-    annotation  dict[str, list[str]]: Annotated files
+    annotation  dict[str, list[str]]: Annotated files, updated in place
 
     Return:
     list[str]               Filtered paths
@@ -197,8 +236,8 @@ def filter_index_fastq_files(
                 )
 
             # Library is single-ended
-            annotation["upstream_file"] = list(sorted(fastq_read_sequences))
-            annotation["index"] = list(sorted(fastq_index_sequences))
+            annotation["upstream_file"] = fastq_read_sequences
+            annotation["index"] = fastq_index_sequences
 
             return (None, annotation)
 
@@ -210,10 +249,9 @@ def filter_index_fastq_files(
                 )
 
             # Library is pair-ended
-            annotation["index"] = list(sorted(fastq_index_sequences))
-            fastq_read_sequences = list(chunked_even(sorted(fastq_read_sequences), 2))
-            annotation["upstream_file"] = [fastq[0] for fastq in fastq_read_sequences]
-            annotation["downstream_file"] = [fastq[1] for fastq in fastq_read_sequences]
+            annotation["index"] = fastq_index_sequences
+            annotation["upstream_file"] = fastq_read_sequences[0::2]
+            annotation["downstream_file"] = fastq_read_sequences[1::2]
 
             return (None, annotation)
 
@@ -233,7 +271,7 @@ def filter_index_fastq_files(
 
 
 def annotate_paths(
-    paths: list[Path], console: Console, verbose: bool = True
+    paths: list[PurePath], console: Console, verbose: bool = True
 ) -> dict[str, dict[str, list[str]]]:
     """
     From a given list of paths, identify pairs, indexes, resequencings and
@@ -241,19 +279,20 @@ def annotate_paths(
     """
     annotation: dict[str, list[str]] = defaultdict(list)
 
-    # Drop duplicated paths
-    paths: list[Path] = list(set(paths))
+    # Drop duplicated paths and sort them once: filters below keep
+    # the input order, so their outputs are sorted as well
+    paths: list[PurePath] = sorted(dict.fromkeys(paths))
 
     # Deal with non-fastq files
     fastq_files, annotation = filter_non_fastq_files(
-        paths, annotation.copy(), console=console, verbose=verbose
+        paths, annotation, console=console, verbose=verbose
     )
-    if (fastq_files is None) or (len(fastq_files) == 0):
+    if not fastq_files:
         raise FileNotFoundError("No fastq file found")
 
     # Deal with index/primer files
     fastq_read_sequences, annotation = filter_index_fastq_files(
-        fastq_files, annotation.copy(), console=console, verbose=verbose
+        fastq_files, annotation, console=console, verbose=verbose
     )
 
     if fastq_read_sequences:
@@ -265,19 +304,23 @@ def annotate_paths(
             other_fastq, console=console, verbose=verbose
         )
 
-        if len(upstream_fastq) == len(downstream_fastq):
+        if (
+            upstream_fastq
+            and downstream_fastq
+            and len(upstream_fastq) == len(downstream_fastq)
+        ):
             # Some files can be paired
             if verbose:
                 console.print("We found pairs of files", style="green")
             annotation["upstream_file"] = sorted(upstream_fastq + other_fastq)
-            annotation["downstream_file"] = sorted(downstream_fastq)
+            annotation["downstream_file"] = downstream_fastq
 
         else:
             if verbose:
                 console.print(
                     "Could not find any pairs of file(s) with confidence", style="green"
                 )
-            annotation["upstream_file"] = sorted(fastq_read_sequences)
+            annotation["upstream_file"] = fastq_read_sequences
     elif "upstream_file" not in annotation.keys():
         raise ValueError(f"No fastq file found in {paths=}")
 
@@ -289,17 +332,16 @@ def remove_common_suffixes(name: str) -> str:
     Remove common suffixes from file names to guess sample names
     """
     # Remove file extension
-    name = re.sub(r"(_|\.)?f(ast)?q(\.gz)?$", "", name)
+    name = fastq_regex.sub("", name)
 
     # Remove stream name
-    name = re.sub(r"_R?(1|2)$", "", name)
+    name = strand_suffix_regex.sub("", name)
 
     # Remove lane number
-
-    name = re.sub(r"_L[0-9]+$", "", name)
+    name = lane_suffix_regex.sub("", name)
 
     # Remove EKDN and ERDN
-    name = re.sub(r"_E(K|R)DN[0-9]+", "", name)
+    name = ekdn_regex.sub("", name)
 
     # Cleaning
     name = name.strip("_").strip(".")
@@ -308,60 +350,76 @@ def remove_common_suffixes(name: str) -> str:
 
 
 def guess_sample_id(
-    samples: pandas.DataFrame, console: Console, verbose: bool = True
-) -> str:
+    upstream_files: list[PurePath],
+    downstream_files: list[PurePath | str],
+    console: Console,
+    verbose: bool = True,
+) -> list[str]:
     """
     Detect samples identifiers from sample paths
     """
     samples_id = []
-    if "downstream_file" in samples.columns:
-        for up, down in zip(samples.upstream_file, samples.downstream_file):
-            if down != "":
-                samples_id.append(
-                    remove_common_suffixes(os.path.commonprefix([up.name, down.name]))
-                )
-            else:
-                samples_id.append(remove_common_suffixes(up.name))
-    else:
-        for up in samples.upstream_file:
-            samples_id.append(remove_common_suffixes(name))
+    upstream_names: list[str] = [up.name for up in upstream_files]
+    downstream_names: list[str] = [
+        down.name if down != "" else "" for down in downstream_files
+    ]
+    for up, down in zip(upstream_names, downstream_names, strict=True):
+        if down != "":
+            samples_id.append(remove_common_suffixes(os.path.commonprefix((up, down))))
+        else:
+            samples_id.append(remove_common_suffixes(up))
 
     return samples_id
 
 
-def as_dataframe(
+def as_records(
     annotated: dict[str, list[str]],
     console: Console,
     organism: str = "homo_sapiens.GRCh38.105",
     verbose: bool = True,
-) -> pandas.DataFrame:
+) -> list[dict[str, str]]:
     """
-    Format annotation table as required by pipelines
+    Format annotation table as required by pipelines,
+    one dictionary per sample
     """
-    samples = pandas.DataFrame.from_dict(
-        {
-            "upstream_file": annotated["upstream_file"],
-            "downstream_file": annotated["downstream_file"],
-        }
-    )
+    upstream_files: list[PurePath] = annotated["upstream_file"]
+    # Single-ended libraries have no downstream file
+    downstream_files: list[PurePath | str] = annotated["downstream_file"]
+    if not downstream_files:
+        downstream_files = [""] * len(upstream_files)
+    elif len(downstream_files) != len(upstream_files):
+        raise ValueError(
+            f"Could not pair {len(upstream_files)} upstream files "
+            f"with {len(downstream_files)} downstream files"
+        )
+
     species, build, release = organism.split(".")
-    samples["species"] = species
-    samples["build"] = build
-    samples["release"] = release
-    samples["sample_id"] = guess_sample_id(
-        samples=samples.copy(), verbose=verbose, console=console
+    samples_id: list[str] = guess_sample_id(
+        upstream_files, downstream_files, verbose=verbose, console=console
     )
-    samples.set_index("sample_id", inplace=True)
+    samples: list[dict[str, str]] = [
+        {
+            "sample_id": sample_id,
+            "upstream_file": str(up),
+            "downstream_file": str(down),
+            "species": species,
+            "build": build,
+            "release": release,
+        }
+        for sample_id, up, down in zip(
+            samples_id, upstream_files, downstream_files, strict=True
+        )
+    ]
 
     if verbose:
-        shape: tuple[int] = samples.shape
-        if shape[0] == 1:
+        if len(samples) == 1:
             console.print(
-                f"{shape[0]} sample was identified and annotated.", style="green"
+                f"{len(samples)} sample was identified and annotated.", style="green"
             )
         else:
             console.print(
-                f"{shape[0]} samples were identified and annotated.", style="green"
+                f"{len(samples)} samples were identified and annotated.",
+                style="green",
             )
 
     return samples
@@ -373,24 +431,27 @@ def search_files_locally(
     """
     Yield all availabe files in the repository and its sub-repositories
     """
-    if isinstance(path, str):
-        path = Path(path)
+    # Paths keep the prefix of the searched directory, as given
+    directories: list[str] = [os.fspath(path)]
+    while directories:
+        directory: str = directories.pop()
+        if verbose:
+            console.print(f"Searching in {directory}", style="green")
 
-    if verbose:
-        console.print(f"Searching in {path.resolve()}", style="green")
+        with os.scandir(directory) as contents:
+            for content in contents:
+                if content.name in skipped_names:
+                    continue
 
-    for content in path.iterdir():
-        if content.name in (".git", ".snakemake"):
-            continue
+                # Directory type comes from the directory listing itself,
+                # only symbolic links require an additional stat
+                if content.is_dir():
+                    directories.append(content.path)
+                    continue
 
-        elif content.is_dir():
-            yield from search_files_locally(
-                path=content, verbose=verbose, console=console
-            )
-
-        if verbose:
-            console.print(f"Found {content.resolve()}", style="green")
-        yield content
+                if verbose:
+                    console.print(f"Found {content.path}", style="green")
+                yield Path(content.path)
 
 
 @click.command(context_settings={"show_default": True})
@@ -462,10 +523,9 @@ def main(
     """
     Search for files (locally or on iRODS) and annotate them
     """
-    console = Console()
     file_list: list[str] = []
     if irods == "None":
-        file_list = sorted(search_files_locally(directory, verbose, console))
+        file_list = list(search_files_locally(directory, verbose, console))
     else:
         raise NotImplementedError("Sorry...")
 
@@ -480,9 +540,13 @@ def main(
         console.print_exception(show_locals=True)
         sys.exit(2)
 
-    samples: pandas.DataFrame = as_dataframe(
-        annotated=annotated, organism=organism, console=console, verbose=verbose
-    )
+    try:
+        samples: list[dict[str, str]] = as_records(
+            annotated=annotated, organism=organism, console=console, verbose=verbose
+        )
+    except ValueError:
+        console.print_exception(show_locals=True)
+        sys.exit(2)
     if isinstance(output, str):
         output = Path(output)
     if not output.parent.exists():
@@ -490,7 +554,12 @@ def main(
     if verbose:
         console.print(samples)
     if (force) or (not output.exists()):
-        samples.to_csv(output, sep=",", header=True, index=True)
+        with open(output, "w", newline="") as samples_stream:
+            writer = csv.DictWriter(
+                samples_stream, fieldnames=sample_columns, lineterminator="\n"
+            )
+            writer.writeheader()
+            writer.writerows(samples)
     else:
         console.print(":warning: Existing file not over-written", style="dark_orange")
 
@@ -8,21 +8,144 @@ import yaml
 from pathlib import Path
 from rich.console import Console
 
+try:
+    from yaml import CSafeLoader as Loader
+except ImportError:
+    from yaml import SafeLoader as Loader
+
+# Shared rich IO
+console: Console = Console()
+
+# Template of the sbatch launcher script
+sbatch_template: str = """#!/usr/bin/bash
+
+# Launch this pipeline with:
+# sbatch {output}
+
+# Slurm parameters
+#SBATCH --job-name='{job_name}'
+#SBATCH --output='{log_dir}/%x_%j_%u.out'
+#SBATCH --error='{log_dir}/%x_%j_%u.err'
+#SBATCH --mem='{mem}'
+#SBATCH --cpus-per-task='1'
+#SBATCH --time='{time}'
+#SBATCH --chdir='{workdir}'
+#SBATCH --partition='{queue}'
+#SBATCH --comment='Snakemake launcher for {job_comment}'
+
+# Ensure bash works properly or stops
+set -eiop 'pipefail'
+shopt -s nullglob
+
+BIGR_DEFAULT_TMP='{tmp_dir}'
+
+# Used locally on Flamingo
+if [ -v ${{BIGR_DEFAULT_TMP}} ]; then
+  BIGR_DEFAULT_TMP='{tmp_dir}'
+fi
+export BIGR_DEFAULT_TMP
+
+if [ -z ${{BIGR_DEFAULT_TMP}} ]; then
+  BIGR_DEFAULT_TMP='{tmp_dir}'
+  export BIGR_DEFAULT_TMP
+fi
+
+# Used in many bash / Python scripts
+if [ -z ${{TMP}} ]; then
+  declare -x TMP
+  TMP='{tmp_dir}'
+  export TMP
+fi
+
+# Used in some bash / R / perl / Python scripts
+if [ -z ${{TEMP}} ]; then
+  declare -x TEMP
+  TEMP='{tmp_dir}'
+  export TEMP
+fi
+
+# Used in some bash / R / perl / Python scripts
+if [ -z ${{TMPDIR}} ]; then
+  declare -x TMPDIR
+  TMPDIR='{tmp_dir}'
+  export TMPDIR
+fi
+
+# Used in some bash / R / perl scripts
+if [ -z ${{TEMPDIR}} ]; then
+  declare -x TEMPDIR
+  TEMPDIR='{tmp_dir}'
+  export TEMPDIR
+fi
+
+# Used in nextflow / java scripts
+if [ -z "${{_JAVA_OPTIONS}}" ]; then
+  declare -x _JAVA_OPTIONS
+  _JAVA_OPTIONS='-Djava.io.tmpdir="{tmp_dir}"'
+  export _JAVA_OPTIONS
+fi
+
+# Declare snakemake cache directory. Used to avoid indexation steps and redundant operations
+declare -x SNAKEMAKE_OUTPUT_CACHE='{snakemake_cache}'
+# Declare conda cache directory. Used to avoid conda reinstallations
+declare -x CONDA_CACHE_PATH='{conda_cache}'
+# Export previously defined variables to current environment
+export SNAKEMAKE_OUTPUT_CACHE
+
+# Logging details
+date
+hostname
+
+# Conda environment
+source '{conda_sh}'
+source '{mamba_sh}'
+conda activate '{conda_env}'
+
+# Run pipeline
+snakemake \\
+  --cores 30 \\
+  --jobs 50 \\
+  --local-cores 2 \\
+  --keep-going \\
+  --rerun-triggers 'mtime' \\
+  --executor slurm-gustave-roussy \\
+  --benchmark-extended \\
+  --rerun-incomplete \\
+  --printshellcmds \\
+  --restart-times 3 \\
+  --show-failed-logs \\
+  --jobname '{{name}}.{{jobid}}.slurm.snakejob.sh' \\
+  --software-deployment-method 'conda' \\
+  --conda-prefix '{conda_prefix}' \\
+  --apptainer-prefix '{apptainer_prefix}' \\
+  --max-jobs-per-second 1 \\
+  --max-status-checks-per-second 1 \\
+  --shadow-prefix '{tmp_dir}'
+"""
+
 
 def time_to_minutes(time: str) -> int:
-    """Convert several time formats into minutes"""
-    if "-" in time:
-        # Then there are days
-        day, hours = time.split("-")
-        hours = time_to_minutes(hours)
-        return int(day) * 1440 + hours
+    """
+    Convert Slurm time formats into minutes: M, M:S, H:M:S,
+    D-H, D-H:M and D-H:M:S
+    """
+    day, dash, clock = time.partition("-")
+    if not dash:
+        day, clock = "0", time
 
-    if ":" in time:
-        # Then there are hours
-        hours, minutes, seconds = time.split(":")
-        return int(round((int(hours) * 60) + int(minutes) + (int(seconds) / 60)))
+    fields: list[str] = clock.split(":")
+    if dash and len(fields) <= 3:
+        # Then clock starts with hours
+        hours, minutes, seconds = (fields + ["0", "0"])[:3]
+    elif len(fields) == 3:
+        hours, minutes, seconds = fields
+    elif len(fields) <= 2:
+        # Then clock starts with minutes
+        hours, minutes, seconds = "0", *(fields + ["0"])[:2]
+    else:
+        raise ValueError(f"Unknown time format: {time}")
 
-    return int(round(time))
+    return int(day) * 1440 + int(hours) * 60 + int(minutes) + (int(seconds) + 30) // 60
 
 
 def minutes_to_human_readable_time(minutes: int) -> str:
@@ -124,7 +247,8 @@ def select_queue(minutes: int) -> str:
     "--time",
     type=str,
     default="0-05:59:59",
-    help="Amount of time required for your pipeline D-H:M:S",
+    help="Amount of time required for your pipeline, "
+    "as M, M:S, H:M:S, D-H, D-H:M or D-H:M:S",
 )
 @click.help_option("-h", "--help")
 def sbatch_creator(
@@ -155,7 +279,13 @@ def sbatch_creator(
     time: str = "5:59:59",
 ) -> None:
     """Create a sbatch launcher script"""
-    console = Console()
+    if isinstance(output, str):
+        output = Path(output)
+
+    # Nothing to build if the script is kept as-is
+    if output.exists() and not force:
+        console.print(":warning: Existing file not over-written", style="dark_orange")
+        return None
 
     if verbose:
         console.print("Building sbatch script...", style="green")
@@ -189,8 +319,8 @@ def sbatch_creator(
 
     # Define project name and description
     with open(config, "r") as config_yaml_stream:
-        config_content: dict[str, str | dict[str, str]] = yaml.safe_load(
-            config_yaml_stream
+        config_content: dict[str, str | dict[str, str]] = yaml.load(
+            config_yaml_stream, Loader=Loader
         )
 
     project_name: str = (
@@ -208,119 +338,32 @@ def sbatch_creator(
         if project_tag != "unknown"
         else project_name
     )
-
-    # Build content of sbatch script
-    sbatch_script_content: tuple[str] = (
-        "#!/usr/bin/bash",
-        "",
-        "# Launch this pipeline with:",
-        f"# sbatch {output}",
-        "",
-        "# Slurm parameters",
-        f"#SBATCH --job-name='{job_name}'",
-        f"#SBATCH --output='{log_dir}/%x_%j_%u.out'",
-        f"#SBATCH --error='{log_dir}/%x_%j_%u.err'",
-        f"#SBATCH --mem='{mem}'",
-        "#SBATCH --cpus-per-task='1'",
-        f"#SBATCH --time='{time}'",
-        f"#SBATCH --chdir='{workdir}'",
-        f"#SBATCH --partition='{queue}'",
-        f"#SBATCH --comment='Snakemake launcher for {job_name.replace('_', ' ')}'",
-        "",
-        "# Ensure bash works properly or stops",
-        "set -eiop 'pipefail'",
-        "shopt -s nullglob",
-        "",
-        f"BIGR_DEFAULT_TMP='{tmp_dir}'",
-        "",
-        "# Used locally on Flamingo",
-        "if [ -v ${BIGR_DEFAULT_TMP} ]; then",
-        f"  BIGR_DEFAULT_TMP='{tmp_dir}'",
-        "fi",
-        "export BIGR_DEFAULT_TMP",
-        "",
-        "if [ -z ${BIGR_DEFAULT_TMP} ]; then",
-        f"  BIGR_DEFAULT_TMP='{tmp_dir}'",
-        "  export BIGR_DEFAULT_TMP",
-        "fi",
-        "",
-        "# Used in many bash / Python scripts",
-        "if [ -z ${TMP} ]; then",
-        "  declare -x TMP",
-        f"  TMP='{tmp_dir}'",
-        "  export TMP",
-        "fi",
-        "",
-        "# Used in some bash / R / perl / Python scripts",
-        "if [ -z ${TEMP} ]; then",
-        "  declare -x TEMP",
-        f"  TEMP='{tmp_dir}'",
-        "  export TEMP",
-        "fi",
-        "",
-        "# Used in some bash / R / perl / Python scripts",
-        "if [ -z ${TMPDIR} ]; then",
-        "  declare -x TMPDIR",
-        f"  TMPDIR='{tmp_dir}'",
-        "  export TMPDIR",
-        "fi",
-        "",
-        "# Used in some bash / R / perl scripts",
-        "if [ -z ${TEMPDIR} ]; then",
-        "  declare -x TEMPDIR",
-        f"  TEMPDIR='{tmp_dir}'",
-        "  export TEMPDIR",
-        "fi",
-        "",
-        "# Used in nextflow / java scripts",
-        'if [ -z "${_JAVA_OPTIONS}" ]; then',
-        "  declare -x _JAVA_OPTIONS",
-        f"  _JAVA_OPTIONS='-Djava.io.tmpdir=\"{tmp_dir}\"'",
-        "  export _JAVA_OPTIONS",
-        "fi",
-        "",
-        "# Declare snakemake cache directory. Used to avoid indexation steps and redundant operations",
-        f"declare -x SNAKEMAKE_OUTPUT_CACHE='{snakemake_cache}'",
-        "# Declare conda cache directory. Used to avoid conda reinstallations",
-        f"declare -x CONDA_CACHE_PATH='{conda_cache}'",
-        "# Export previously defined variables to current environment",
-        "export SNAKEMAKE_OUTPUT_CACHE",
-        "",
-        "# Logging details",
-        "date",
-        "hostname",
-        "",
-        "# Conda environment",
-        f"source '{conda_sh}'",
-        f"source '{mamba_sh}'",
-        f"conda activate '{conda_env}'",
-        "",
-        "# Run pipeline",
-        f"snakemake \\",
-        "  --cores 30 \\",
-        "  --jobs 50 \\",
-        "  --local-cores 2 \\",
-        "  --keep-going \\",
-        "  --rerun-triggers 'mtime' \\",
-        "  --executor slurm-gustave-roussy \\",
-        "  --benchmark-extended \\",
-        "  --rerun-incomplete \\",
-        "  --printshellcmds \\",
-        "  --restart-times 3 \\",
-        "  --show-failed-logs \\",
-        "  --jobname '{name}.{jobid}.slurm.snakejob.sh' \\",
-        "  --software-deployment-method 'conda' \\",
-        f"  --conda-prefix '{conda_prefix}' \\",
-        f"  --apptainer-prefix '{apptainer_prefix}' \\",
-        "  --max-jobs-per-second 1 \\",
-        "  --max-status-checks-per-second 1 \\",
-        f"  --shadow-prefix '{tmp_dir}'",
-        "",
-    )
+    job_comment: str = job_name.replace("_", " ")
 
     # Save sbatch script
     with open(output, "w") as sbatch_script_stream:
-        sbatch_script_stream.write("\n".join(sbatch_script_content))
+        sbatch_script_stream.write(
+            sbatch_template.format_map(
+                {
+                    "apptainer_prefix": apptainer_prefix,
+                    "conda_cache": conda_cache,
+                    "conda_env": conda_env,
+                    "conda_prefix": conda_prefix,
+                    "conda_sh": conda_sh,
+                    "job_comment": job_comment,
+                    "job_name": job_name,
+                    "log_dir": log_dir,
+                    "mamba_sh": mamba_sh,
+                    "mem": mem,
+                    "output": output,
+                    "queue": queue,
+                    "snakemake_cache": snakemake_cache,
+                    "time": time,
+                    "tmp_dir": tmp_dir,
+                    "workdir": workdir,
+                }
+            )
+        )
 
     if verbose:
         console.print(":ballot_box_with_check: Sbatch script available", style="green")
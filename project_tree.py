@@ -1,120 +1,300 @@
 # coding: utf-8
 
 
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 from rich.markup import escape
-from pathlib import Path
 from rich import print
 from rich.filesize import decimal
 from rich.text import Text
 from rich.tree import Tree
-from typing import Generator
+from typing import Generator, Iterator
 from rich.console import Console
 
 import rich_click as click
+import io
 import os
 import sys
 
+# Shared rich IO
+console: Console = Console()
 
-def walkthrough(directory: Path, tree: Tree, skip_hidden: bool = False) -> None:
+
+# Icon and description of files, by file name
+named_file_types: dict[str, tuple[str, str]] = {
+    "Snakefile": (":snake:", "Snakemake script"),
+}
+
+# Icon and description of files, by file extension
+file_types: dict[str, tuple[str, str]] = {
+    ".smk": (":snake:", "Snakemake script"),
+    ".py": (":snake:", "Python script"),
+    ".pyc": (":snake:", "Python binary file"),
+    ".log": (":newspaper:", "Logging file"),
+    **dict.fromkeys((".png", ".svg", ".pdf"), (":bar_chart:", "Chart image")),
+    ".md": (":regional_indicator_m:", "Text ressource"),
+    **dict.fromkeys((".rst", ".txt"), (":regional_indicator_t:", "Text ressource")),
+    **dict.fromkeys(
+        (".R", ".Rmd", ".r", ".rmd"), (":regional_indicator_r:", "R script")
+    ),
+    **dict.fromkeys((".sh", ".bash", ".sbatch", ".zsh"), (":scroll:", "Shell script")),
+    **dict.fromkeys((".csv", ".tsv", ".xlsx"), (":input_numbers:", "Table")),
+    **dict.fromkeys((".bam", ".sam", ".cram", ".bai"), (":dna:", "Alignment file")),
+    **dict.fromkeys((".json", ".yaml", ".yml"), (":receipt:", "Configuration file")),
+    **dict.fromkeys(
+        (".fq", ".fastq", ".fq.gz", ".fastq.gz"), (":dna:", "Sequenced reads")
+    ),
+    **dict.fromkeys(
+        (".bed", ".bed.gz", ".gtf", ".gff", ".gff3"),
+        (":input_numbers:", "Genomic intervals"),
+    ),
+    **dict.fromkeys(
+        (".fasta", ".fa", ".fna", ".fai", ".dict", ".bt2"),
+        (":dna:", "Genomic sequences"),
+    ),
+    ".html": (":globe_showing_europe-africa:", "HTML report"),
+    **dict.fromkeys(
+        (
+            ".bcf",
+            ".vcf",
+            ".vcf.gz",
+            ".gvcf",
+            ".gvcf.gz",
+            ".maf",
+            ".vcf.gz.tbi",
+            ".vcf.gz.csi",
+            ".ubcf",
+        ),
+        (":dna:", "Variants description"),
+    ),
+    ".bin": (":computer_disk:", "Binary file"),
+}
+
+# Number of parts in the longest known file extension (.vcf.gz.tbi)
+file_type_parts: int = max(suffix.count(".") for suffix in file_types)
+
+# Icon and description of unknown files
+default_file_type: tuple[str, str] = (":bookmark_tabs:", "")
+
+# Tree label of files, by icon and description: only path, name
+# and size are left to fill in
+file_labels: dict[tuple[str, str], str] = {
+    (icon, description): (
+        f"{icon} [link file://%s]%s\t(%s)" + (f"\t{description}" if description else "")
+    )
+    for icon, description in (
+        *named_file_types.values(),
+        *file_types.values(),
+        default_file_type,
+    )
+}
+
+# Tree label of directories: only path and name are left to fill in
+directory_label: str = ":open_file_folder: [link file://%s]%s"
+
+# Number of directories listed at once
+scan_workers: int = 32
+
+# Tree label of directories that were not listed
+truncated_label: str = "…"
+
+# Rich styles of tree nodes
+file_style: dict[str, str] = {"style": "white", "guide_style": "cyan"}
+directory_style: dict[str, str] = {"style": "green", "guide_style": "cyan"}
+
+
+def escape_name(name: str) -> str:
+    """Escape rich markup in a file name, when there is any to escape"""
+    if ("[" in name) or name.endswith("\\"):
+        return escape(name)
+    return name
+
+
+@lru_cache(maxsize=4096)
+def file_size(size: int) -> str:
+    """Human readable file size, many files share the same size"""
+    return decimal(size)
+
+
+def file_type(name: str) -> tuple[str, str]:
+    """Return icon and description of a file, given its name"""
+    if name in named_file_types:
+        return named_file_types[name]
+
+    # Search extensions from the shortest to the longest one,
+    # a leading dot in hidden files is not an extension
+    dot: int = name.rfind(".")
+    for _ in range(file_type_parts):
+        if dot <= 0:
+            break
+        found: tuple[str, str] | None = file_types.get(name[dot:])
+        if found is not None:
+            return found
+        dot = name.rfind(".", 0, dot)
+
+    return default_file_type
+
+
+def scan_directory(
+    directory: str, skip_hidden: bool = False
+) -> list[tuple[str, str, bool, int]]:
     """
-    Recursively build a Tree with directory contents.
-    https://github.com/Textualize/rich/blob/master/examples/tree.py
+    List the content of a single directory: name, path, directory status
+    and size of each entry. Directories are listed first, then files,
+    both sorted by name.
     """
+    # Directory entries cache their type and stat results,
+    # hidden ones are dropped before any of them is queried
+    with os.scandir(directory) as contents:
+        paths: list[os.DirEntry] = [
+            path for path in contents if not (skip_hidden and path.name.startswith("."))
+        ]
+
+    # Query file sizes in inode order, closer to their on-disk layout
+    sizes: dict[str, int] = {
+        path.name: path.stat().st_size
+        for path in sorted(paths, key=os.DirEntry.inode)
+        if not path.is_dir()
+    }
+
     # Sort dirs first then by filename
-    paths = sorted(
-        Path(directory).iterdir(),
-        key=lambda path: (path.is_file(), path.name.lower()),
+    paths.sort(key=lambda path: (path.is_file(), path.name.casefold()))
+    entries: list[tuple[str, str, bool, int]] = [
+        (path.name, path.path, path.name not in sizes, sizes.get(path.name, 0))
+        for path in paths
+    ]
+
+    return entries
+
+
+def scan_tree(
+    directory: str,
+    skip_hidden: bool = False,
+    max_depth: int | None = None,
+    max_entries: int | None = None,
+) -> dict[str, list[tuple[str, str, bool, int]]]:
+    """
+    List the content of all directories, breadth first, directories
+    of a same depth are listed in parallel. Directories deeper than
+    max_depth, or found after max_entries entries, are not listed.
+    Return the entries of each listed directory, by directory path.
+    """
+    contents: dict[str, list[tuple[str, str, bool, int]]] = {}
+    directories: list[str] = [directory]
+    depth: int = 0
+    count: int = 0
+    full: bool = False
+    with ThreadPoolExecutor(max_workers=scan_workers) as executor:
+        while directories and not full and (max_depth is None or depth < max_depth):
+            subdirectories: list[str] = []
+            # Directories are submitted by batches, so that no more than one
+            # batch is listed once max_entries is reached
+            for start in range(0, len(directories), scan_workers):
+                batch: list[str] = directories[start : start + scan_workers]
+                scans: list[Future] = [
+                    executor.submit(scan_directory, path, skip_hidden) for path in batch
+                ]
+                for path, scan in zip(batch, scans):
+                    full = max_entries is not None and count >= max_entries
+                    if full:
+                        break
+                    entries: list[tuple[str, str, bool, int]] = scan.result()
+                    contents[path] = entries
+                    count += len(entries)
+                    subdirectories += [
+                        subdirectory for _, subdirectory, is_dir, _ in entries if is_dir
+                    ]
+
+                full = max_entries is not None and count >= max_entries
+                if full:
+                    for scan in scans:
+                        scan.cancel()
+                    break
+
+            directories = subdirectories
+            depth += 1
+
+    return contents
+
+
+def walkthrough(
+    directory: str,
+    tree: Tree,
+    skip_hidden: bool = False,
+    max_depth: int | None = None,
+    max_entries: int | None = None,
+) -> None:
+    """
+    Build a Tree with directory contents.
+    Links are built from entry paths: provide an absolute directory.
+    https://github.com/Textualize/rich/blob/master/examples/tree.py
+    """
+    contents: dict[str, list[tuple[str, str, bool, int]]] = scan_tree(
+        directory, skip_hidden, max_depth, max_entries
     )
-    for path in paths:
-        if skip_hidden and path.name.startswith("."):
-            continue
 
-        if path.is_dir():
-            branch = tree.add(
-                f":open_file_folder: [link file://{path.resolve()}]{escape(path.name)}",
-                style="green",
-                guide_style="cyan",
-            )
-            walkthrough(path, branch)
-        else:
-            icon: str = ":bookmark_tabs:"
-            description: str = "\t"
-            if (path.name == "Snakefile") or (path.suffix in (".smk")):
-                icon = ":snake:"
-                description += "Snakemake script"
-            elif path.suffix == ".py":
-                icon = ":snake:"
-                description += "Python script"
-            elif path.suffix == ".pyc":
-                icon = ":snake:"
-                description += "Python binary file"
-            elif path.suffix == ".log":
-                icon = ":newspaper:"
-                description += "Logging file"
-            elif path.suffix in (".png", ".svg", ".pdf"):
-                icon = ":bar_chart:"
-                description += "Chart image"
-            elif path.suffix in (".md", ".rst", ".txt"):
-                icon = ":regional_indicator_m:"
-                description += "Text ressource"
-            elif path.suffix in (".rst", ".txt"):
-                icon = ":regional_indicator_t:"
-                description += "Text ressource"
-            elif path.suffix in (".R", ".Rmd", ".r", ".rmd"):
-                icon = ":regional_indicator_r:"
-                description += "R script"
-            elif path.suffix in (".sh", ".bash", ".sbatch", ".zsh"):
-                icon = ":scroll:"
-                description += "Shell script"
-            elif path.suffix in (".csv", ".tsv", ".xlsx"):
-                icon = ":input_numbers:"
-                description += "Table"
-            elif path.suffix in (".bam", ".sam", ".cram", ".bai"):
-                icon = ":dna:"
-                description += "Alignment file"
-            elif path.suffix in (".json", ".yaml", ".yml"):
-                icon = ":receipt:"
-                description += "Configuration file"
-            elif path.name.endswith((".fq", ".fastq", ".fq.gz", ".fastq.gz")):
-                icon = ":dna:"
-                description += "Sequenced reads"
-            elif path.name.endswith((".bed", ".bed.gz", ".gtf", ".gff", ".gff3")):
-                icon = ":input_numbers:"
-                description += "Genomic intervals"
-            elif path.name.endswith((".fasta", ".fa", ".fna", ".fai", ".dict", ".bt2")):
-                icon = ":dna:"
-                description += "Genomic sequences"
-            elif path.suffix == ".html":
-                icon = ":globe_showing_europe-africa:"
-                description += "HTML report"
-            elif path.name.endswith(
-                (
-                    ".bcf",
-                    ".vcf",
-                    ".vcf.gz",
-                    ".gvcf",
-                    ".gvcf.gz",
-                    ".maf",
-                    ".vcf.gz.tbi",
-                    ".vcf.gz.csi",
-                    ".ubcf",
+    # Directories left to add, along with their branch in the tree
+    directories: list[tuple[str, Tree]] = [(directory, tree)]
+    while directories:
+        directory, tree = directories.pop()
+        for name, path, is_dir, size in contents[directory]:
+            if is_dir:
+                branch = tree.add(
+                    directory_label % (path, escape_name(name)), **directory_style
                 )
-            ):
-                icon = ":dna:"
-                description += "Variants description"
-            elif path.suffix == ".bin":
-                icon = ":computer_disk:"
-                description += "Binary file"
+                if path in contents:
+                    directories.append((path, branch))
+                else:
+                    # Directory was not listed
+                    branch.add(truncated_label, **directory_style)
             else:
-                description = ""
+                tree.add(
+                    file_labels[file_type(name)]
+                    % (path, escape_name(name), file_size(size)),
+                    **file_style,
+                )
+
+
+def plain_walkthrough(
+    directory: str,
+    skip_hidden: bool = False,
+    max_depth: int | None = None,
+    max_entries: int | None = None,
+) -> str:
+    """
+    Build a plain text tree with directory contents, one indented line
+    per entry, without rich renderables.
+    """
+    contents: dict[str, list[tuple[str, str, bool, int]]] = scan_tree(
+        directory, skip_hidden, max_depth, max_entries
+    )
+    text: io.StringIO = io.StringIO()
+    text.write(f"{directory}\n")
+
+    # Entries left to write, one iterator per directory depth
+    entries: list[Iterator[tuple[str, str, bool, int]]] = [iter(contents[directory])]
+    while entries:
+        entry: tuple[str, str, bool, int] | None = next(entries[-1], None)
+        if entry is None:
+            entries.pop()
+            continue
 
-            size: str = str(decimal(path.stat().st_size))
+        name, path, is_dir, size = entry
+        indent: str = "  " * len(entries)
+        if is_dir:
+            text.write(f"{indent}{name}/\n")
+            if path in contents:
+                entries.append(iter(contents[path]))
+            else:
+                # Directory was not listed
+                text.write(f"{indent}  {truncated_label}\n")
+        else:
+            description: str = file_type(name)[1]
+            if description:
+                description = f"\t{description}"
+            text.write(f"{indent}{name}\t({file_size(size)}){description}\n")
 
-            tree.add(
-                f"{icon} [link file://{path.resolve()}]{escape(path.name)}\t({size}){description}",
-                style="white",
-                guide_style="cyan",
-            )
+    return text.getvalue()
 
 
 def check_path(path: str) -> None:
@@ -126,24 +306,52 @@ def check_path(path: str) -> None:
 @click.command(context_settings={"show_default": True})
 @click.option("-d", "--directory", default=os.getcwd(), type=click.Path())
 @click.option("-s", "--skip_hidden", is_flag=True, default=False)
-def tree(directory: str = os.getcwd(), skip_hidden: bool = False) -> None:
+@click.option(
+    "-p",
+    "--plain",
+    is_flag=True,
+    default=False,
+    help="Print a plain text tree, lighter on large directories",
+)
+@click.option(
+    "--max_depth",
+    type=click.IntRange(min=1),
+    default=None,
+    show_default="no limit",
+    help="Maximum depth of listed directories",
+)
+@click.option(
+    "--max_entries",
+    type=click.IntRange(min=1),
+    default=None,
+    show_default="no limit",
+    help="Stop listing directories once this number of entries is reached",
+)
+def tree(
+    directory: str = os.getcwd(),
+    skip_hidden: bool = False,
+    plain: bool = False,
+    max_depth: int | None = None,
+    max_entries: int | None = None,
+) -> None:
     """Produce an annotated tree of the target directory"""
-    console = Console()
-
     try:
         check_path(directory)
     except FileNotFoundError:
         console.print_exception(show_locals=True)
         sys.exit(1)
 
-    if isinstance(directory, str):
-        directory = Path(directory)
+    # Entries found below an absolute path are absolute themselves
+    root: str = os.path.abspath(directory)
+    if plain:
+        sys.stdout.write(plain_walkthrough(root, skip_hidden, max_depth, max_entries))
+        return None
 
     tree = Tree(
-        f":open_file_folder: [link file://{directory.resolve()}]{directory}",
+        f":open_file_folder: [link file://{root}]{directory}",
         guide_style="cyan",
     )
-    walkthrough(directory, tree, skip_hidden)
+    walkthrough(root, tree, skip_hidden, max_depth, max_entries)
     print(tree)
 
 